@@ -1,6 +1,6 @@
 import re
 import sys
-from collections import defaultdict
+from collections import Counter, defaultdict
 from collections.abc import Callable
 from datetime import date, timedelta
 from pathlib import Path
@@ -37,6 +37,8 @@ logger.add("logs/piecework.log", format=json_log_format, rotation="500 MB")
 
 app = typer.Typer()
 
+SUMMARY_COLUMNS = ["NAME", "TYPE", "COUNT", "UNIT", "COST", "TOTAL PAY"]
+
 
 def get_report_clients(config: Config) -> pd.DataFrame | None:
     """Find clients who have reports done, and who either: haven't been ran before, or were ran on the same day."""
@@ -86,7 +88,7 @@ def get_report_clients(config: Config) -> pd.DataFrame | None:
                     & (punch_list["Evaluator"].str.lower() == "ap")
                 )
             )
-        ].copy()
+        ]
 
         if report_done.empty:
             logger.info("No clients found that have reports done")
@@ -99,12 +101,9 @@ def get_report_clients(config: Config) -> pd.DataFrame | None:
 
         logger.info(f"Loaded report history: {len(tracked_reports)}")
 
-        is_tracked_today = report_done["Client ID"].astype(str).isin(tracked_reports)
-        matches_today = (
-            report_done["Client ID"].astype(str).map(tracked_reports) == today_str
-        )
-
-        new_reports = report_done[~is_tracked_today | matches_today].copy()
+        # One lookup per client: untracked IDs map to NaN
+        tracked_dates = report_done["Client ID"].astype(str).map(tracked_reports)
+        new_reports = report_done[tracked_dates.isna() | (tracked_dates == today_str)]
 
         if new_reports.empty:
             logger.info("No new reports found")
@@ -187,14 +186,14 @@ def get_report_clients(config: Config) -> pd.DataFrame | None:
             return None
 
         # Only resolve from initials for rows not already auto-filled via writesOwnReports
+        # Writers appear on many rows, so each distinct set of initials is looked up once
         needs_lookup = result["Writer Name"] == ""
-        result.loc[needs_lookup, "Writer Name"] = result.loc[
-            needs_lookup, "Initials"
-        ].apply(
-            lambda initials: (
-                config.piecework.get_full_name(initials) if initials else ""
-            )
-        )
+        initials_to_resolve = result.loc[needs_lookup, "Initials"]
+        full_names = {
+            initials: config.piecework.get_full_name(initials) if initials else ""
+            for initials in initials_to_resolve.unique()
+        }
+        result.loc[needs_lookup, "Writer Name"] = initials_to_resolve.map(full_names)
 
         # Warn if any writer names could not be resolved
         unresolved = result[result["Writer Name"] == ""]
@@ -293,7 +292,7 @@ def get_work_counts(
 
     Returns a dict mapping evaluator name to appointment type counts.
     """
-    counts: dict[int | str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+    counts: Counter[tuple[int | str, str]] = Counter()
     worker_names: dict[int | str, str] = {}
 
     for appointment in appointments:
@@ -320,99 +319,65 @@ def get_work_counts(
 
         asd_adhd = appointment.get("asdAdhd")
         if da_eval == "DA" and asd_adhd == "ADHD":
-            counts[npi]["ADHDDA"] += 1
+            counts[(npi, "ADHDDA")] += 1
         else:
-            counts[npi][str(da_eval)] += 1
+            counts[(npi, str(da_eval))] += 1
 
     if report_clients is not None and not report_clients.empty:
+        # Reverse index so each report row is matched to an evaluator in one lookup
+        key_by_name: dict[str, int | str] = {}
+        for key, name in worker_names.items():
+            key_by_name.setdefault(name, key)
+
         for _, row in report_clients.iterrows():
             writer_name = row.get("Writer Name", "")
             if writer_name:
-                existing_npi = next(
-                    (npi for npi, name in worker_names.items() if name == writer_name),
-                    None,
-                )
+                existing_key = key_by_name.get(writer_name)
 
-                if existing_npi is not None:
-                    counts[existing_npi]["REPORT"] = (
-                        counts[existing_npi].get("REPORT", 0) + 1
-                    )
+                if existing_key is not None:
+                    counts[(existing_key, "REPORT")] += 1
                 else:
                     worker_names[writer_name] = writer_name
-                    counts[writer_name]["REPORT"] = (
-                        counts[writer_name].get("REPORT", 0) + 1
-                    )
+                    key_by_name[writer_name] = writer_name
+                    counts[(writer_name, "REPORT")] += 1
+
+    logger.info(f"Total work piece count: {counts.total()}")
 
-    total_work_count = sum(sum(counts.values()) for counts in counts.values())
-    logger.info(f"Total work piece count: {total_work_count}")
+    counts_by_worker: dict[int | str, dict[str, int]] = defaultdict(dict)
+    for (key, work_type), count in counts.items():
+        counts_by_worker[key][work_type] = count
 
     return {
-        worker_names.get(key, f"Unknown Worker (Key: {key})"): dict(da_eval_counts)
-        for key, da_eval_counts in counts.items()
+        worker_names.get(key, f"Unknown Worker (Key: {key})"): type_counts
+        for key, type_counts in counts_by_worker.items()
     }
 
 
 def prepare_summary_data(
     work_counts: dict[str, dict[str, int]], config: Config
-) -> list[dict]:
+) -> list[tuple]:
     """Prepares the aggregated appointment counts for the Summary Counts DataFrame.
 
     The evaluator name appears on its own row, followed by rows with type/count data.
+    Each row is a tuple ordered like SUMMARY_COLUMNS.
     """
+    blank_row = ("", "", "", "", "", "")
     summary_rows = []
 
     for worker_name, app_counts in sorted(work_counts.items()):
-        summary_rows.append(
-            {
-                "NAME": worker_name,
-                "TYPE": "",
-                "COUNT": "",
-                "UNIT": "",
-                "COST": "",
-                "TOTAL PAY": "",
-            }
-        )
+        summary_rows.append((worker_name, "", "", "", "", ""))
 
-        sorted_app_types = sorted(app_counts.keys())
         evaluator_total = 0.00
 
-        for app_type in sorted_app_types:
+        for app_type in sorted(app_counts):
             count = app_counts[app_type]
             unit_cost = config.piecework.get_unit_cost(worker_name, app_type)
             total_cost = count * unit_cost
             evaluator_total += total_cost
-            summary_rows.append(
-                {
-                    "NAME": "",
-                    "TYPE": app_type,
-                    "COUNT": count,
-                    "UNIT": unit_cost,
-                    "COST": total_cost,
-                    "TOTAL PAY": "",
-                }
-            )
+            summary_rows.append(("", app_type, count, unit_cost, total_cost, ""))
 
-        summary_rows.append(
-            {
-                "NAME": "",
-                "TYPE": "",
-                "COUNT": "",
-                "UNIT": "",
-                "COST": "",
-                "TOTAL PAY": evaluator_total,
-            }
-        )
-
-        summary_rows.append(
-            {
-                "NAME": "",
-                "TYPE": "",
-                "COUNT": "",
-                "UNIT": "",
-                "COST": "",
-                "TOTAL PAY": "",
-            }
-        )
+        summary_rows.append(("", "", "", "", "", evaluator_total))
+        summary_rows.append(blank_row)
 
     return summary_rows
 
@@ -492,7 +457,7 @@ def _autofit_columns(sheet) -> None:
 
 
 def generate_main_report(
-    summary_data: list[dict],
+    summary_data: list[tuple],
     detail_data: list[dict],
     start_date: date,
     end_date: date,
@@ -508,7 +473,7 @@ def generate_main_report(
         / f"piecework_{start_date.strftime('%y-%m-%d')}_{end_date.strftime('%y-%m-%d')}.xlsx"
     )
 
-    df_summary = pd.DataFrame(summary_data)
+    df_summary = pd.DataFrame(summary_data, columns=SUMMARY_COLUMNS)
     df_detail = pd.DataFrame(detail_data)
 
     file_generated = False
@@ -522,20 +487,20 @@ def generate_main_report(
 
             currency_format = '"$"#,##0.00'
 
-            for row_idx, row in enumerate(
+            for row_idx, (_, _, _, unit, cost, total_pay) in enumerate(
                 summary_data, start=2
             ):  # start=2 to skip header
-                if row.get("UNIT"):
+                if unit:
                     summary_sheet.cell(
                         row=row_idx, column=4
                     ).number_format = currency_format
 
-                if row.get("COST"):
+                if cost:
                     summary_sheet.cell(
                         row=row_idx, column=5
                     ).number_format = currency_format
 
-                if row.get("TOTAL PAY"):
+                if total_pay:
                     summary_sheet.cell(
                         row=row_idx, column=6
                     ).number_format = currency_format
@@ -9,6 +9,7 @@ from dateutil.relativedelta import relativedelta
 from loguru import logger
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from utils.constants import PENDING_STATUSES
 from utils.custom_types import (
     AdminEmailInfo,
     ClientFromDB,
@@ -27,7 +28,8 @@ from utils.database import (
     has_requested_records_date,
     log_questionnaire_msg,
     log_referral_msg,
-    update_failure_in_db,
+    record_failure_checks_in_db,
+    update_failures_in_db,
     update_questionnaires_in_db,
 )
 from utils.google import (
@@ -52,7 +54,12 @@ from utils.questionnaires import (
     filter_inactive_and_not_pending,
     get_most_recent_not_done,
 )
-from utils.quo import InvalidPhoneNumberError, NotEnoughCreditsError, Quo
+from utils.quo import (
+    InvalidPhoneNumberError,
+    NotEnoughCreditsError,
+    Quo,
+    phone_number_key,
+)
 from utils.selenium import (
     initialize_selenium,
 )
@@ -70,6 +77,19 @@ app = typer.Typer()
 
 PENDING_EMAIL_PATH = Path("logs/pending_email.json")
 
+# Days to wait since the last reminder, keyed by how many reminders were already sent
+REMINDER_SCHEDULE: dict[int, int] = {
+    0: 0,  # Initial message (same day)
+    1: 14,  # First follow-up (2 weeks later)
+    2: 7,  # Second follow-up (1 week after first follow-up)
+}
+
+# Texts for failures a client can fix themselves, formatted with the sender's name
+FAILURE_MESSAGES: dict[str, str] = {
+    "portal not opened": "Hi, this is {name} from Driftwood Evaluation Center. We noticed you haven't accessed the patient portal, TherapyAppointment as of yet. I resent the invite through email. We won't be able to move ahead with scheduling the appointment until this is done. Please let us know if you have any questions or need assistance. Thank you.",
+    "docs not signed": 'This is {name} from Driftwood Evaluation Center. We see that you signed into your portal at portal.therapyappointment.com but you didn\'t complete the Forms under the "Forms" section. Please sign back in, navigate to the Forms section, and complete the forms not marked as "Completed" to move forward with the evaluation process. Thank you!',
+}
+
 
 def _serialize_email_info(email_info: AdminEmailInfo) -> dict:
     """Turn an AdminEmailInfo (holding live pydantic client objects) into plain JSON.
@@ -213,24 +233,16 @@ def _load_pending_email() -> list[AdminEmailInfo]:
 def build_failure_message(config: Config, client: FailedClientFromDB) -> str | None:
     """Builds a message to be sent to the client based on their failure."""
     for failure_data in client.failure:
-        reason = failure_data["reason"]
-        if reason == "portal not opened":
-            return f"Hi, this is {config.name} from Driftwood Evaluation Center. We noticed you haven't accessed the patient portal, TherapyAppointment as of yet. I resent the invite through email. We won't be able to move ahead with scheduling the appointment until this is done. Please let us know if you have any questions or need assistance. Thank you."
-        if reason == "docs not signed":
-            return f'This is {config.name} from Driftwood Evaluation Center. We see that you signed into your portal at portal.therapyappointment.com but you didn\'t complete the Forms under the "Forms" section. Please sign back in, navigate to the Forms section, and complete the forms not marked as "Completed" to move forward with the evaluation process. Thank you!'
+        template = FAILURE_MESSAGES.get(failure_data["reason"])
+        if template is not None:
+            return template.format(name=config.name)
 
     return None
 
 
 def should_send_reminder(reminded_count: int, last_reminded_distance: int) -> bool:
     """Checks if a reminder should be sent to the client, based on the last reminder distance."""
-    reminder_schedule = {
-        0: 0,  # Initial message (same day)
-        1: 14,  # First follow-up (2 weeks later)
-        2: 7,  # Second follow-up (1 week after first follow-up)
-    }
-
-    expected_day = reminder_schedule.get(reminded_count)
+    expected_day = REMINDER_SCHEDULE.get(reminded_count)
     if expected_day is not None and last_reminded_distance >= expected_day:
         logger.debug(
             f"Reminder should be sent because client has been reminded {reminded_count} times, and it has been {last_reminded_distance} days since the last reminder"
@@ -245,46 +257,68 @@ def check_failures(
     driver: WebDriver,
     failed_clients: dict[int, FailedClientFromDB],
     progress_callback: Callable[[int, int], None] | None = None,
-):
-    """Checks the failures of clients and updates them in the database."""
+) -> dict[int, FailedClientFromDB]:
+    """Checks the failures of clients and updates them in the database.
+
+    Returns:
+        The clients that still have unresolved failures, with any failures
+        resolved by this check removed.
+    """
     logger.debug("Checking on failures for clients")
     # Matches the "too young for asd"/"too young for adhd" failure reasons below:
     # ASD questionnaires require the client to be at least 2, ADHD at least 5.
-    two_years_ago = date.today() - relativedelta(years=2)
-    five_years_ago = date.today() - relativedelta(years=5)
+    today = date.today()
+    two_years_ago = today - relativedelta(years=2)
+    five_years_ago = today - relativedelta(years=5)
 
+    still_failed: dict[int, FailedClientFromDB] = {}
     total = len(failed_clients)
-    for done, (client_id, client) in enumerate(failed_clients.items(), start=1):
-        for failure_data in client.failure:
-            reason = failure_data["reason"]
-            is_resolved = False
-
-            if reason in ["portal not opened", "docs not signed"]:
-                go_to_client(driver, services, str(client_id))
-                if reason == "portal not opened":
-                    is_resolved = check_if_opened_portal(driver)
-                elif reason == "docs not signed":
-                    is_resolved = check_if_docs_signed(driver)
-
-            elif reason == "too young for asd" and client.dob is not None:
-                is_resolved = client.dob < two_years_ago
-
-            elif reason == "too young for adhd" and client.dob is not None:
-                is_resolved = client.dob < five_years_ago
-
-            elif reason == "District on receive does not match district on send":
-                is_resolved = has_requested_records_date(
-                    config, client_id, client.sessionStartedAt
-                )
+    # (client_id, reason) pairs, written in one batch once the checks finish
+    resolved_keys: list[tuple[int, str]] = []
+    unresolved_keys: list[tuple[int, str]] = []
+    try:
+        for done, (client_id, client) in enumerate(failed_clients.items(), start=1):
+            unresolved = []
+            for failure_data in client.failure:
+                reason = failure_data["reason"]
+                is_resolved = False
+
+                if reason in ["portal not opened", "docs not signed"]:
+                    go_to_client(driver, services, str(client_id))
+                    if reason == "portal not opened":
+                        is_resolved = check_if_opened_portal(driver)
+                    elif reason == "docs not signed":
+                        is_resolved = check_if_docs_signed(driver)
+
+                elif reason == "too young for asd" and client.dob is not None:
+                    is_resolved = client.dob < two_years_ago
+
+                elif reason == "too young for adhd" and client.dob is not None:
+                    is_resolved = client.dob < five_years_ago
+
+                elif reason == "District on receive does not match district on send":
+                    is_resolved = has_requested_records_date(
+                        config, client_id, client.sessionStartedAt
+                    )
 
-            if is_resolved:
-                update_failure_in_db(config, client_id, reason, resolved=True)
-                logger.info(f"Resolved failure for {client.fullName}")
-            else:
-                update_failure_in_db(config, client_id, reason)
+                if is_resolved:
+                    resolved_keys.append((client_id, reason))
+                    logger.info(f"Resolved failure for {client.fullName}")
+                else:
+                    unresolved_keys.append((client_id, reason))
+                    unresolved.append(failure_data)
+
+            if unresolved:
+                client.failure = unresolved
+                still_failed[client_id] = client
+
+            if progress_callback:
+                progress_callback(done, total)
+    finally:
+        # Save whatever was checked, even if the browser dies partway through
+        record_failure_checks_in_db(config, resolved_keys, unresolved_keys)
 
-        if progress_callback:
-            progress_callback(done, total)
+    return still_failed
 
 
 @app.command()
@@ -396,7 +430,9 @@ def main(
     # qreceive is cron-run multiple times a day, but texts/admin emails should
     # only go out once daily — the 1pm run is the designated send window.
     # Other runs still check/update status, just without notifying anyone.
-    start_hour = datetime.now().hour
+    # One clock reading for the whole run, so dates written to the DB all match
+    started_at = datetime.now()
+    start_hour = started_at.hour
     is_send_time = start_hour == 13
     send_texts = (is_send_time or force_send) and not dry_run
 
@@ -406,7 +442,7 @@ def main(
         )
     if not is_send_time and not force_send and not dry_run:
         logger.info(
-            f"Current hour is {datetime.now().hour} — texts will not be sent outside the 1pm window. Use --force-send to override."
+            f"Current hour is {start_hour} — texts will not be sent outside the 1pm window. Use --force-send to override."
         )
     if force_send:
         logger.warning("--force-send active — sending texts regardless of time.")
@@ -437,13 +473,22 @@ def main(
             "completed": [],
             "errors": [],
         }
+        # Only launched when there are failures to look up in TA
+        driver: WebDriver | None = None
+        # Reminder state changes, saved in one batch in the finally block so a
+        # crash partway through the run can't drop them.
+        # failure_updates holds (client_id, reason, reminded, last_reminded).
+        questionnaire_updates: list[ClientWithQuestionnaires] = []
+        failure_updates: list[tuple[int, str, int, date]] = []
 
         try:
+            today = started_at.date()
             clients, failed_clients = get_previous_clients(config, True)
             if clients is None:
                 logger.critical("Failed to get previous clients")
                 raise RuntimeError("Failed to get previous clients")
 
+            all_clients_raw = dict(clients)  # unvalidated, used for referral messages
             clients = validate_questionnaires(clients)
             all_clients_with_qs = dict(clients)  # unfiltered, used for end-of-run sync
             clients = filter_inactive_and_not_pending(clients)
@@ -456,10 +501,9 @@ def main(
                 progress_callback=task.progress,
             )
 
-            driver = None
-            if not skip_failures:
+            if not skip_failures and failed_clients:
                 driver = initialize_selenium()
-                check_failures(
+                failed_clients = check_failures(
                     config,
                     services,
                     driver,
@@ -467,13 +511,15 @@ def main(
                     progress_callback=task.progress,
                 )
 
-            clients, failed_clients = get_previous_clients(config, failed=True)
-            all_clients_raw = dict(clients)
+            # check_questionnaires marks completions on these same client objects and
+            # check_failures drops resolved failures, so there's no need to reload
+            clients = all_clients_with_qs
 
             messages_sent: list[
                 tuple[FailedClientFromDB | ClientWithQuestionnaires, str, str | None]
             ] = []
-            numbers_sent = []
+            # Keyed by phone_number_key so formatting differences don't defeat the dedupe
+            numbers_sent: set[str] = set()
 
             completed_ids = {c.id for c in email_info["completed"]}
             if failed_clients and not skip_failures:
@@ -517,7 +563,9 @@ def main(
                         last_reminded = most_recent_failure["lastReminded"]
 
                         if last_reminded is not None:
-                            last_reminded_distance = check_distance(last_reminded)
+                            last_reminded_distance = check_distance(
+                                last_reminded, today
+                            )
                         else:
                             last_reminded_distance = 0
 
@@ -530,7 +578,9 @@ def main(
                             email_info["failed"].append((client, "No phone number"))
                             continue
 
-                        already_messaged_today = client.phoneNumber in numbers_sent
+                        already_messaged_today = (
+                            phone_number_key(client.phoneNumber) in numbers_sent
+                        )
 
                         if already_messaged_today:
                             logger.warning(
@@ -545,12 +595,8 @@ def main(
                             and client.id not in completed_ids
                         ):
                             email_info["call"].append(client)
-                            update_failure_in_db(
-                                config,
-                                client.id,
-                                reason,
-                                reminded=reminded_count + 1,
-                                last_reminded=date.today(),
+                            failure_updates.append(
+                                (client.id, reason, reminded_count + 1, today)
                             )
 
                         elif (
@@ -565,7 +611,8 @@ def main(
                                 if reason == "portal not opened":
                                     if send_texts:
                                         try:
-                                            assert driver is not None
+                                            if driver is None:
+                                                driver = initialize_selenium()
                                             resend_portal_invite(
                                                 driver, services, str(client.id)
                                             )
@@ -600,7 +647,9 @@ def main(
                                         )
 
                                         if attempt_text and "id" in attempt_text:
-                                            numbers_sent.append(client.phoneNumber)
+                                            numbers_sent.add(
+                                                phone_number_key(client.phoneNumber)
+                                            )
                                             messages_sent.append(
                                                 (client, attempt_text["id"], reason)
                                             )
@@ -647,171 +696,155 @@ def main(
                                         f"[DRY RUN] Would text {client.fullName} ({client.phoneNumber}):\n{message}"
                                     )
 
-            if clients:
-                clients = validate_questionnaires(clients)
-                for client in clients.values():
-                    done = all_questionnaires_done(client)
+            for client in clients.values():
+                if check_if_ignoring(client):
+                    logger.warning(f"{client.fullName} is being ignored.")
+                    email_info["ignoring"].append(client)
+                    continue
 
-                    if check_if_ignoring(client):
-                        logger.warning(f"{client.fullName} is being ignored.")
-                        email_info["ignoring"].append(client)
-                        continue
+                if any(client.fullName in error for error in email_info["errors"]):
+                    logger.warning(f"{client.fullName} has an error, skipping")
+                    continue
 
-                    if any(client.fullName in error for error in email_info["errors"]):
-                        logger.warning(f"{client.fullName} has an error, skipping")
-                        continue
+                if client.autismStop:
+                    logger.warning(f"{client.fullName} has autism stop, skipping")
+                    continue
 
-                    if client.autismStop:
-                        logger.warning(f"{client.fullName} has autism stop, skipping")
-                        continue
-
-                    if client.pause:
-                        logger.warning(f"{client.fullName} has been paused, skipping")
-                        continue
-
-                    if not done:
-                        most_recent_q = get_most_recent_not_done(client)
-                        if not most_recent_q or not most_recent_q["sent"]:
-                            logger.warning(
-                                f"{client.fullName} has no pending questionnaires with dates, skipping"
-                            )
-                            continue
-                        distance = check_distance(most_recent_q["sent"])
-                        last_reminded = most_recent_q.get("lastReminded")
-                        if last_reminded is not None:
-                            last_reminded_distance = check_distance(last_reminded)
-                        else:
-                            last_reminded_distance = 0
+                if client.pause:
+                    logger.warning(f"{client.fullName} has been paused, skipping")
+                    continue
 
+                if all_questionnaires_done(client):
+                    if client in email_info["completed"]:
                         logger.info(
-                            f"{client.fullName} had questionnaire sent on {most_recent_q['sent']} and isn't done"
+                            f"{client.fullName} completed all questionnaires — punchlist will be synced at end of run"
                         )
+                    continue
 
-                        if not client.phoneNumber:
-                            logger.warning(f"{client.fullName} has no phone number")
-                            email_info["failed"].append((client, "No phone number"))
-                            continue
+                most_recent_q = get_most_recent_not_done(client)
+                if not most_recent_q or not most_recent_q["sent"]:
+                    logger.warning(
+                        f"{client.fullName} has no pending questionnaires with dates, skipping"
+                    )
+                    continue
+                distance = check_distance(most_recent_q["sent"], today)
+                last_reminded = most_recent_q.get("lastReminded")
+                if last_reminded is not None:
+                    last_reminded_distance = check_distance(last_reminded, today)
+                else:
+                    last_reminded_distance = 0
 
-                        already_messaged_today = client.phoneNumber in numbers_sent
+                logger.info(
+                    f"{client.fullName} had questionnaire sent on {most_recent_q['sent']} and isn't done"
+                )
 
-                        if already_messaged_today:
-                            logger.warning(
-                                f"Already messaged {client.fullName} at {client.phoneNumber} today"
-                            )
+                if not client.phoneNumber:
+                    logger.warning(f"{client.fullName} has no phone number")
+                    email_info["failed"].append((client, "No phone number"))
+                    continue
 
-                        if (
-                            most_recent_q["reminded"] == 3
-                            and last_reminded_distance >= 3
-                        ):
-                            email_info["call"].append(client)
+                already_messaged_today = (
+                    phone_number_key(client.phoneNumber) in numbers_sent
+                )
 
-                        elif (
-                            most_recent_q["reminded"] < 3
-                            and not already_messaged_today
-                            and client.phoneNumber
-                            and should_send_reminder(
-                                most_recent_q["reminded"], last_reminded_distance
-                            )
-                        ):
-                            if (
-                                most_recent_q["reminded"] == 2
-                                and most_recent_q["sent"] is not None
-                            ):
-                                has_replied = quo.has_client_replied(
-                                    client.phoneNumber, since=most_recent_q["sent"]
-                                )
-                                if has_replied:
-                                    logger.info(
-                                        f"{client.fullName} has replied since questionnaires were sent — skipping final reminder, setting questionnaires to IGNORING"
-                                    )
-                                    for q in client.questionnaires:
-                                        if q["status"] in (
-                                            "PENDING",
-                                            "POSTDA_PENDING",
-                                            "POSTEVAL_PENDING",
-                                        ):
-                                            q["status"] = "IGNORING"
-                                    if not dry_run:
-                                        update_questionnaires_in_db(config, [client])
-                                    else:
-                                        logger.info(
-                                            f"[DRY RUN] Would set {client.fullName}'s questionnaires to IGNORING"
-                                        )
-                                    email_info["ignoring"].append(client)
-                                    continue
+                if already_messaged_today:
+                    logger.warning(
+                        f"Already messaged {client.fullName} at {client.phoneNumber} today"
+                    )
+
+                if most_recent_q["reminded"] == 3 and last_reminded_distance >= 3:
+                    email_info["call"].append(client)
+                    continue
 
-                            logger.info(f"Sending reminder TO {client.fullName}")
-                            message = build_q_message(
-                                config, client, most_recent_q, distance
+                if (
+                    most_recent_q["reminded"] >= 3
+                    or already_messaged_today
+                    or not should_send_reminder(
+                        most_recent_q["reminded"], last_reminded_distance
+                    )
+                ):
+                    continue
+
+                if most_recent_q["reminded"] == 2 and most_recent_q["sent"] is not None:
+                    has_replied = quo.has_client_replied(
+                        client.phoneNumber, since=most_recent_q["sent"]
+                    )
+                    if has_replied:
+                        logger.info(
+                            f"{client.fullName} has replied since questionnaires were sent — skipping final reminder, setting questionnaires to IGNORING"
+                        )
+                        for q in client.questionnaires:
+                            if q["status"] in PENDING_STATUSES:
+                                q["status"] = "IGNORING"
+                        if not dry_run:
+                            questionnaire_updates.append(client)
+                        else:
+                            logger.info(
+                                f"[DRY RUN] Would set {client.fullName}'s questionnaires to IGNORING"
                             )
-                            # Redundant failsafe to super ensure we don't text people a message that just says "None"
-                            if not message:
-                                logger.error(
-                                    f"Failed to build message for {client.fullName}"
-                                )
-                                continue
+                        email_info["ignoring"].append(client)
+                        continue
 
-                            if send_texts:
-                                try:
-                                    attempt_text = quo.send_text(
-                                        message, client.phoneNumber, mark_done=True
-                                    )
+                logger.info(f"Sending reminder TO {client.fullName}")
+                message = build_q_message(
+                    config, client, most_recent_q, distance, today
+                )
+                # Redundant failsafe to super ensure we don't text people a message that just says "None"
+                if not message:
+                    logger.error(f"Failed to build message for {client.fullName}")
+                    continue
+
+                if send_texts:
+                    try:
+                        attempt_text = quo.send_text(
+                            message, client.phoneNumber, mark_done=True
+                        )
 
-                                    if attempt_text and "id" in attempt_text:
-                                        numbers_sent.append(client.phoneNumber)
-                                        messages_sent.append(
-                                            (client, attempt_text["id"], None)
-                                        )
-                                        try:
-                                            log_questionnaire_msg(
-                                                config,
-                                                client.id,
-                                                attempt_text["id"],
-                                                is_failure_reminder=False,
-                                            )
-                                        except Exception as log_err:
-                                            logger.error(
-                                                f"Failed to log automated message: {log_err}"
-                                            )
-                                    else:
-                                        logger.error(
-                                            f"Failed to send message to {client.fullName}"
-                                        )
-                                        email_info["failed"].append(
-                                            (client, "Failed to send text request")
-                                        )
-                                except InvalidPhoneNumberError as e:
-                                    logger.error(
-                                        f"Invalid phone number for {client.fullName}: {e}"
-                                    )
-                                    email_info["failed"].append(
-                                        (
-                                            client,
-                                            f"Invalid phone number: {client.phoneNumber}",
-                                        )
-                                    )
-                                except NotEnoughCreditsError:
-                                    logger.critical(
-                                        "Aborting all further message sends due to insufficient credits."
-                                    )
-                                    email_info["errors"].append(
-                                        "Quo API needs more credits to send messages."
-                                    )
-                                    break
-                            elif dry_run:
-                                logger.info(
-                                    f"[DRY RUN] Would text {client.fullName} ({client.phoneNumber}):\n{message}"
+                        if attempt_text and "id" in attempt_text:
+                            numbers_sent.add(phone_number_key(client.phoneNumber))
+                            messages_sent.append((client, attempt_text["id"], None))
+                            try:
+                                log_questionnaire_msg(
+                                    config,
+                                    client.id,
+                                    attempt_text["id"],
+                                    is_failure_reminder=False,
                                 )
-                    elif client in email_info["completed"]:
-                        logger.info(
-                            f"{client.fullName} completed all questionnaires — punchlist will be synced at end of run"
+                            except Exception as log_err:
+                                logger.error(
+                                    f"Failed to log automated message: {log_err}"
+                                )
+                        else:
+                            logger.error(f"Failed to send message to {client.fullName}")
+                            email_info["failed"].append(
+                                (client, "Failed to send text request")
+                            )
+                    except InvalidPhoneNumberError as e:
+                        logger.error(f"Invalid phone number for {client.fullName}: {e}")
+                        email_info["failed"].append(
+                            (
+                                client,
+                                f"Invalid phone number: {client.phoneNumber}",
+                            )
                         )
+                    except NotEnoughCreditsError:
+                        logger.critical(
+                            "Aborting all further message sends due to insufficient credits."
+                        )
+                        email_info["errors"].append(
+                            "Quo API needs more credits to send messages."
+                        )
+                        break
+                elif dry_run:
+                    logger.info(
+                        f"[DRY RUN] Would text {client.fullName} ({client.phoneNumber}):\n{message}"
+                    )
 
             referral_msg = "This is Driftwood Evaluation Center. We have received your referral. We are managing a very large amount of patients and will reach out to you as soon as we can. Thank you!"
             referral_messages_sent: list[tuple[ClientFromDB, str]] = []
 
             if send_texts or dry_run:
-                cutoff_date = date.today() - timedelta(days=1)
+                cutoff_date = today - timedelta(days=1)
                 sent_referral_ids = get_sent_referral_client_ids(config)
                 new_clients = [
                     c
@@ -835,7 +868,7 @@ def main(
                             (client, "New referral — no phone number")
                         )
                         continue
-                    if client.phoneNumber in numbers_sent:
+                    if phone_number_key(client.phoneNumber) in numbers_sent:
                         logger.warning(
                             f"Already messaged {client.fullName} today, skipping referral msg"
                         )
@@ -849,7 +882,7 @@ def main(
                                 referral_msg, client.phoneNumber, mark_done=True
                             )
                             if attempt_text and "id" in attempt_text:
-                                numbers_sent.append(client.phoneNumber)
+                                numbers_sent.add(phone_number_key(client.phoneNumber))
                                 referral_messages_sent.append(
                                     (client, attempt_text["id"])
                                 )
@@ -886,13 +919,17 @@ def main(
                             f"[DRY RUN] Would send referral msg to {client.fullName} ({client.phoneNumber}):\n{referral_msg}"
                         )
 
-            logger.info(f"Starting status check for {len(messages_sent)} messages.")
-
-            clients_to_update_db = []
+            logger.info(
+                f"Starting status check for {len(messages_sent)} messages and {len(referral_messages_sent)} referral message(s)."
+            )
+            delivery_status = quo.check_texts_delivered(
+                [message_id for _, message_id, _ in messages_sent]
+                + [message_id for _, message_id in referral_messages_sent]
+            )
 
             for client, message_id, failure_reason in messages_sent:
                 try:
-                    delivered = quo.check_text_delivered(message_id)
+                    delivered = delivery_status[message_id]
 
                     if delivered:
                         logger.success(
@@ -912,9 +949,8 @@ def main(
                             )
                             if failure_to_update:
                                 new_reminded_count = failure_to_update["reminded"] + 1
-                                today = date.today()
 
-                                clients_to_update_db.append(
+                                failure_updates.append(
                                     (
                                         client.id,
                                         failure_reason,
@@ -928,14 +964,10 @@ def main(
                                 )
                         elif isinstance(client, ClientWithQuestionnaires):
                             for q in client.questionnaires:
-                                if (
-                                    q["status"] == "PENDING"
-                                    or q["status"] == "POSTDA_PENDING"
-                                    or q["status"] == "POSTEVAL_PENDING"
-                                ):
+                                if q["status"] in PENDING_STATUSES:
                                     q["reminded"] += 1
-                                    q["lastReminded"] = date.today()
-                            clients_to_update_db.append(client)
+                                    q["lastReminded"] = today
+                            questionnaire_updates.append(client)
                     else:
                         logger.error(
                             f"Failed to deliver message to {client.fullName} ({message_id})"
@@ -951,25 +983,9 @@ def main(
                         f"Error checking message status for {client.fullName}: {e}"
                     )
 
-            for client in clients_to_update_db:
-                if isinstance(client, ClientWithQuestionnaires):
-                    update_questionnaires_in_db(config, [client])
-                else:
-                    client_id, reason, reminded, last_reminded = client
-                    update_failure_in_db(
-                        config,
-                        client_id,
-                        reason,
-                        reminded=reminded,
-                        last_reminded=last_reminded,
-                    )
-
-            logger.info(
-                f"Starting status check for {len(referral_messages_sent)} referral message(s)."
-            )
             for client, message_id in referral_messages_sent:
                 try:
-                    delivered = quo.check_text_delivered(message_id)
+                    delivered = delivery_status[message_id]
                     if delivered:
                         logger.success(
                             f"Delivered referral msg to {client.fullName} ({message_id})"
@@ -1037,6 +1053,25 @@ def main(
             email_info["errors"].append(error_message)
             raise
         finally:
+            try:
+                if questionnaire_updates:
+                    update_questionnaires_in_db(config, questionnaire_updates)
+                update_failures_in_db(config, failure_updates)
+            except Exception as e:
+                # Still send the admin email below, with the failure in it
+                logger.exception("Failed to save reminder updates to the DB")
+                email_info["errors"].append(
+                    f"Failed to save reminder updates to the DB: {e}"
+                )
+
+            if driver is not None:
+                logger.debug("Closing WebDriver.")
+                try:
+                    driver.quit()
+                except Exception:
+                    # Don't let a dead browser stop the admin email below
+                    logger.exception("Failed to close the WebDriver")
+
             if is_send_time or force_send:
                 earlier_runs = _load_pending_email()
                 all_infos = [*earlier_runs, email_info]
@@ -1049,7 +1084,7 @@ def main(
                         try:
                             send_gmail(
                                 message_text=admin_email_text,
-                                subject=f"Receive Run for {datetime.today().strftime('%a, %b')} {datetime.today().day}",
+                                subject=f"Receive Run for {started_at.strftime('%a, %b')} {started_at.day}",
                                 to_addr=",".join(config.qreceive_emails),
                                 from_addr=config.automated_email,
                                 html=admin_email_html,
@@ -1,7 +1,7 @@
 import re
 import sys
 from datetime import date, datetime
-from time import sleep, strftime, strptime
+from time import sleep
 
 import pandas as pd
 import typer
@@ -381,7 +381,8 @@ def extract_client_data(driver: WebDriver) -> dict[str, str | int]:
         driver, By.XPATH, "//div[contains(normalize-space(text()), 'DOB ')]"
     ).text
     birthdate_str = birthdate_element.split(" ")[-1]
-    birthdate = strftime("%Y/%m/%d", strptime(birthdate_str, "%m/%d/%Y"))
+    birth_datetime = datetime.strptime(birthdate_str, "%m/%d/%Y")
+    birthdate = birth_datetime.strftime("%Y/%m/%d")
     phone_number_element = find_element(
         driver, By.CSS_SELECTOR, "a[aria-description=' current default phone'"
     )
@@ -399,7 +400,7 @@ def extract_client_data(driver: WebDriver) -> dict[str, str | int]:
     sleep(0.5)
     gender = gender_element.text.split(" ")[0]
 
-    age = relativedelta(datetime.now(), datetime.strptime(birthdate, "%Y/%m/%d")).years
+    age = relativedelta(datetime.now(), birth_datetime).years
     logger.success("Returned client data")
     return {
         "firstname": firstname,
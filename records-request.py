@@ -6,7 +6,6 @@ from datetime import date
 
 import pymupdf
 import typer
-from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseUpload
 from loguru import logger
 from selenium.webdriver.common.by import By
@@ -22,7 +21,7 @@ from utils.database import (
     update_failure_in_db,
 )
 from utils.google import (
-    google_authenticate,
+    get_google_service,
     move_file_in_drive,
     send_gmail,
 )
@@ -67,9 +66,7 @@ def download_consent_forms(
     dry_run: bool = False,
 ) -> bool:
     """Navigates to Docs & Forms and saves consent forms as PDFs."""
-    creds = google_authenticate()
-
-    service = build("drive", "v3", credentials=creds)
+    service = get_google_service("drive", "v3")
 
     logger.debug("Checking if files already exist...")
     check_filename = f"{client.firstName} {client.lastName} {client.dob.strftime('%m%d%Y')} Receiving.pdf"
@@ -222,9 +219,7 @@ def upload_pdf_from_driver(
         logger.info(f"[DRY RUN] Would upload {filename} to Drive folder {folder_id}")
         return pdf_stream, filename, school, {}
 
-    creds = google_authenticate()
-
-    service = build("drive", "v3", credentials=creds)
+    service = get_google_service("drive", "v3")
     file_metadata = {
         "name": filename,
         "parents": [folder_id],
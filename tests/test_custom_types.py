@@ -52,6 +52,12 @@ class TestGetFullName:
         config = make_piecework_config()
         assert config.get_full_name("zz") == ""
 
+    def test_mixed_case_config_keys(self):
+        config = PieceworkConfig(
+            costs={}, name_map={"Jd": "Jane Doe"}, payroll_emails={}
+        )
+        assert config.get_full_name("jD") == "Jane Doe"
+
 
 def make_client_from_db(client_id: int, questionnaires=None) -> ClientFromDB:
     return ClientFromDB.model_validate(
@@ -126,3 +126,13 @@ class TestBuildQMessage:
         message = build_q_message(config, client, q, 0)
         assert message is not None
         assert "comprehensive report" in message
+
+    def test_final_notice_deadline_is_three_days_after_today(
+        self, config_factory, client_factory, questionnaire_factory
+    ):
+        config = config_factory()
+        q = questionnaire_factory(sent=date(2024, 1, 1), reminded=2)
+        client = client_factory(questionnaires=[q])
+        message = build_q_message(config, client, q, 60, today=date(2024, 3, 1))
+        assert message is not None
+        assert "completed by 03/04 (3 days from now)" in message
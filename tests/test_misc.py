@@ -20,6 +20,9 @@ class TestCheckDistance:
     def test_check_distance(self, offset_days, expected):
         assert check_distance(date.today() - timedelta(days=offset_days)) == expected
 
+    def test_check_distance_to_given_day(self):
+        assert check_distance(date(2024, 1, 1), today=date(2024, 1, 31)) == 30
+
 
 def make_record(message: str) -> "loguru.Record":
     return cast(
@@ -137,29 +137,13 @@ class TestPrepareSummaryData:
         work_counts = {"Dr. A": {"DA": 2, "EVAL": 1}}
         rows = piecework_module.prepare_summary_data(work_counts, config)
 
-        assert rows[0] == {
-            "NAME": "Dr. A",
-            "TYPE": "",
-            "COUNT": "",
-            "UNIT": "",
-            "COST": "",
-            "TOTAL PAY": "",
-        }
-        assert rows[1]["TYPE"] == "DA"
-        assert rows[1]["COUNT"] == 2
-        assert rows[1]["UNIT"] == 10.0
-        assert rows[1]["COST"] == 20.0
-        assert rows[2]["TYPE"] == "EVAL"
-        assert rows[2]["COST"] == 20.0
-        assert rows[3]["TOTAL PAY"] == 40.0
-        assert rows[4] == {
-            "NAME": "",
-            "TYPE": "",
-            "COUNT": "",
-            "UNIT": "",
-            "COST": "",
-            "TOTAL PAY": "",
-        }
+        assert rows == [
+            ("Dr. A", "", "", "", "", ""),
+            ("", "DA", 2, 10.0, 20.0, ""),
+            ("", "EVAL", 1, 20.0, 20.0, ""),
+            ("", "", "", "", "", 40.0),
+            ("", "", "", "", "", ""),
+        ]
 
     def test_workers_sorted_alphabetically(self, piecework_module, config_factory):
         config = config_factory(
@@ -171,7 +155,7 @@ class TestPrepareSummaryData:
         )
         work_counts = {"Zed": {"DA": 1}, "Alice": {"DA": 1}}
         rows = piecework_module.prepare_summary_data(work_counts, config)
-        name_rows = [r["NAME"] for r in rows if r["NAME"]]
+        name_rows = [name for name, *_ in rows if name]
         assert name_rows == ["Alice", "Zed"]
 
 
@@ -7,6 +7,7 @@ from qreceive import (
     _merge_email_infos,
     _serialize_email_info,
     build_failure_message,
+    check_failures,
     should_send_reminder,
 )
 from utils.custom_types import AdminEmailInfo, FailedClientFromDB
@@ -80,6 +81,30 @@ class TestBuildFailureMessage:
             assert expected_substring in message
 
 
+class TestCheckFailures:
+    def test_drops_resolved_failures(self, config_factory, monkeypatch):
+        db_updates = []
+        monkeypatch.setattr(
+            "qreceive.record_failure_checks_in_db",
+            lambda _config, resolved, unresolved: db_updates.append(
+                (resolved, unresolved)
+            ),
+        )
+        old_enough = make_failed_client(1, reason="too young for asd")
+        too_young = make_failed_client(2, reason="too young for adhd")
+        too_young.dob = date.today()
+
+        still_failed = check_failures(
+            config_factory(),
+            None,  # type: ignore[arg-type]
+            None,  # type: ignore[arg-type]
+            {1: old_enough, 2: too_young},
+        )
+
+        assert list(still_failed) == [2]
+        assert db_updates == [([(1, "too young for asd")], [(2, "too young for adhd")])]
+
+
 class TestMergeEmailInfos:
     def test_dedupes_by_client_id_across_runs(self, client_factory):
         client = client_factory(client_id=1)
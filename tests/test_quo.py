@@ -1,8 +1,23 @@
+from types import SimpleNamespace
+
 import pytest
 import requests
-from ratelimit import RateLimitException
 
-from utils.quo import is_transient_error, should_continue_polling
+from utils.custom_types import OpenPhoneService
+from utils.quo import (
+    Quo,
+    _TokenBucket,
+    is_safe_to_resend,
+    is_transient_error,
+    phone_number_key,
+    should_continue_polling,
+)
+
+
+def make_response(status_code: int) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    return response
 
 
 class TestShouldContinuePolling:
@@ -20,6 +35,18 @@ class TestShouldContinuePolling:
         assert should_continue_polling(status) == expected
 
 
+class TestPhoneNumberKey:
+    @pytest.mark.parametrize(
+        "phone",
+        ["8035551234", "(803) 555-1234", "803-555-1234", "+1 803 555 1234"],
+    )
+    def test_formats_share_a_key(self, phone):
+        assert phone_number_key(phone) == "8035551234"
+
+    def test_malformed_number_keeps_its_digits(self):
+        assert phone_number_key("555-1234") == "5551234"
+
+
 class TestIsTransientError:
     @pytest.mark.parametrize("status_code", [400, 401, 403, 404, 422])
     def test_non_transient_http_errors_are_not_retried(self, status_code):
@@ -41,8 +68,92 @@ class TestIsTransientError:
     def test_connection_error_is_retried(self):
         assert is_transient_error(requests.ConnectionError()) is True
 
-    def test_rate_limit_exception_is_retried(self):
-        assert is_transient_error(RateLimitException("slow down", 1)) is True
-
     def test_unrelated_exception_is_not_retried(self):
         assert is_transient_error(ValueError("nope")) is False
+
+
+class TestIsSafeToResend:
+    def test_rate_limited_send_is_retried(self):
+        error = requests.HTTPError(response=make_response(429))
+        assert is_safe_to_resend(error) is True
+
+    @pytest.mark.parametrize("status_code", [400, 500, 502, 503])
+    def test_other_http_errors_are_not_retried(self, status_code):
+        error = requests.HTTPError(response=make_response(status_code))
+        assert is_safe_to_resend(error) is False
+
+    def test_connect_timeout_is_retried(self):
+        assert is_safe_to_resend(requests.ConnectTimeout()) is True
+
+    @pytest.mark.parametrize(
+        "error", [requests.ConnectionError(), requests.ReadTimeout()]
+    )
+    def test_errors_after_connecting_are_not_retried(self, error):
+        assert is_safe_to_resend(error) is False
+
+
+class TestSendText:
+    def test_server_error_is_not_resent(self, config_factory, monkeypatch):
+        services = SimpleNamespace(
+            openphone=OpenPhoneService(
+                key="test-key", main_number="+18035550000", users={}
+            )
+        )
+        quo = Quo(config_factory(), services)  # type: ignore[arg-type]
+        posts = []
+
+        def fake_post(url, **_kwargs):
+            posts.append(url)
+            return make_response(500)
+
+        monkeypatch.setattr(quo.session, "post", fake_post)
+
+        with pytest.raises(requests.HTTPError):
+            quo.send_text("Hello", "803-555-1234")
+        assert len(posts) == 1
+
+
+class FakeClock:
+    """Stands in for time.monotonic/time.sleep so bucket tests never really wait."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        clock = FakeClock()
+        # Swap the module's time reference so the real time module stays untouched
+        monkeypatch.setattr(
+            "utils.quo.time",
+            SimpleNamespace(monotonic=clock.monotonic, sleep=clock.sleep),
+        )
+        return clock
+
+    def test_burst_up_to_capacity_does_not_wait(self, clock):
+        bucket = _TokenBucket(capacity=3, rate=1.0)
+        for _ in range(3):
+            bucket.take()
+        assert clock.sleeps == []
+
+    def test_waits_for_a_token_once_empty(self, clock):
+        bucket = _TokenBucket(capacity=1, rate=20.0)
+        bucket.take()
+        bucket.take()
+        assert clock.sleeps == [pytest.approx(0.05)]
+
+    def test_refills_over_time(self, clock):
+        bucket = _TokenBucket(capacity=1, rate=20.0)
+        bucket.take()
+        clock.now += 0.05
+        bucket.take()
+        assert clock.sleeps == []
@@ -25,12 +25,15 @@ class TestResolveSchoolContact:
         [
             ("Charleston", "charleston"),
             ("ccsd", "charleston"),
+            ("chas", "charleston"),
             ("berkeley", None),
         ],
     )
     def test_resolve_school_contact(self, query, expected_name):
         contacts = {
-            "charleston": RecordsContact(email="a@example.com", aliases=["CCSD"]),
+            "charleston": RecordsContact(
+                email="a@example.com", aliases=["CCSD", " Chas "]
+            ),
         }
         name, contact = resolve_school_contact(query, contacts)
         assert name == expected_name
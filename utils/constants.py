@@ -16,3 +16,7 @@ TEST_NAMES: Final = [
     "Test Testerson",
 ]
 TEST_NAMES_LOWER: Final = {n.lower() for n in TEST_NAMES}
+
+# Questionnaire statuses that still need the client to fill them out. "SPANISH"
+# would belong here once Spanish reminders are supported.
+PENDING_STATUSES: Final = frozenset({"PENDING", "POSTDA_PENDING", "POSTEVAL_PENDING"})
@@ -83,6 +83,15 @@ class PieceworkConfig(BaseModel):
     name_map: dict[str, str]
     payroll_emails: dict[str, EmailStr]
 
+    @field_validator("name_map")
+    @classmethod
+    def lowercase_name_map_keys(cls, v: dict[str, str]) -> dict[str, str]:
+        """Lowercase the initials once so lookups don't have to."""
+        normalized: dict[str, str] = {}
+        for initials, full_name in v.items():
+            normalized.setdefault(initials.lower(), full_name)
+        return normalized
+
     def get_unit_cost(self, evaluator_name: str, appointment_type: str) -> float:
         """Get the unit cost for a specific evaluator and appointment type.
 
@@ -114,11 +123,7 @@ class PieceworkConfig(BaseModel):
         Returns:
             Full name if found, otherwise returns the original initials
         """
-        initials_lower = initials.lower()
-        for k, v in self.name_map.items():
-            if k.lower() == initials_lower:
-                return v
-        return ""
+        return self.name_map.get(initials.lower(), "")
 
 
 class RecordsContact(BaseModel):
@@ -128,6 +133,12 @@ class RecordsContact(BaseModel):
     fax: bool = False
     aliases: list[str]
 
+    @field_validator("aliases")
+    @classmethod
+    def normalize_aliases(cls, v: list[str]) -> list[str]:
+        """Lowercase and strip aliases once so lookups can compare directly."""
+        return [alias.lower().strip() for alias in v]
+
     @field_validator("email")
     @classmethod
     def validate_email(cls, v: str) -> str:
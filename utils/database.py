@@ -50,15 +50,19 @@ def get_previous_clients(
         cursor.execute(sql)
         clients = cursor.fetchall()
 
+        # Group questionnaires by client in one pass instead of scanning the
+        # whole table once per client
         sql = "SELECT * FROM emr_questionnaire"
         cursor.execute(sql)
-        questionnaires = cursor.fetchall()
+        client_questionnaires: dict[int, list[dict]] = {}
+        for questionnaire in cursor.fetchall():
+            client_id = questionnaire["clientId"]
+            if client_id not in client_questionnaires:
+                client_questionnaires[client_id] = []
+            client_questionnaires[client_id].append(questionnaire)
+
         for client in clients:
-            client["questionnaires"] = [
-                questionnaire
-                for questionnaire in questionnaires
-                if questionnaire["clientId"] == client["id"]
-            ]
+            client["questionnaires"] = client_questionnaires.get(client["id"], [])
 
     # Create a dictionary of clients with their IDs as keys
     prev_clients = {}
@@ -441,24 +445,26 @@ def update_questionnaires_in_db(
     db_connection = get_db(config)
     with db_connection:
         with db_connection.cursor() as cursor:
-            for client in clients:
-                for questionnaire in client.questionnaires:
-                    sql = """
-                        UPDATE `emr_questionnaire`
-                        SET status=%s, reminded=%s, lastReminded=%s, updated_at = NOW()
-                        WHERE clientId=%s AND sent=%s AND questionnaireType=%s
-                    """
-
-                    values = (
-                        questionnaire["status"],
-                        questionnaire["reminded"],
-                        questionnaire["lastReminded"],
-                        client.id,
-                        questionnaire["sent"],
-                        questionnaire["questionnaireType"],
-                    )
-
-                    cursor.execute(sql, values)
+            sql = """
+                UPDATE `emr_questionnaire`
+                SET status=%s, reminded=%s, lastReminded=%s, updated_at = NOW()
+                WHERE clientId=%s AND sent=%s AND questionnaireType=%s
+            """
+
+            values = [
+                (
+                    questionnaire["status"],
+                    questionnaire["reminded"],
+                    questionnaire["lastReminded"],
+                    client.id,
+                    questionnaire["sent"],
+                    questionnaire["questionnaireType"],
+                )
+                for client in clients
+                for questionnaire in client.questionnaires
+            ]
+
+            cursor.executemany(sql, values)
         db_connection.commit()
 
 
@@ -531,6 +537,49 @@ def update_failure_in_db(
         db_connection.commit()
 
 
+def record_failure_checks_in_db(
+    config: Config,
+    resolved: list[tuple[int, str]],
+    unresolved: list[tuple[int, str]],
+) -> None:
+    """Mark the resolved (client_id, reason) failures resolved and touch updated_at on the rest."""
+    if not resolved and not unresolved:
+        return
+    db_connection = get_db(config)
+    with db_connection, db_connection.cursor() as cursor:
+        if resolved:
+            # +100 marks a failure as resolved while preserving its reminder count,
+            # matching update_failure_in_db(resolved=True).
+            cursor.executemany(
+                "UPDATE emr_failure SET reminded=reminded + 100 WHERE clientId=%s AND reason=%s",
+                resolved,
+            )
+        if unresolved:
+            cursor.executemany(
+                "UPDATE emr_failure SET updated_at = NOW() WHERE clientId=%s AND reason=%s",
+                unresolved,
+            )
+        db_connection.commit()
+
+
+def update_failures_in_db(
+    config: Config, updates: list[tuple[int, str, int, date]]
+) -> None:
+    """Set reminded and lastReminded on many failures, given (client_id, reason, reminded, last_reminded) tuples."""
+    if not updates:
+        return
+    db_connection = get_db(config)
+    with db_connection, db_connection.cursor() as cursor:
+        cursor.executemany(
+            "UPDATE emr_failure SET reminded=%s, lastReminded=%s WHERE clientId=%s AND reason=%s",
+            [
+                (reminded, last_reminded, client_id, reason)
+                for client_id, reason, reminded, last_reminded in updates
+            ],
+        )
+        db_connection.commit()
+
+
 def get_sent_referral_client_ids(config: Config) -> set[int]:
     """Return the set of client IDs that have already been sent a referral message."""
     db_connection = get_db(config)
@@ -1,6 +1,7 @@
 import base64
 import mimetypes
 import re
+import tempfile
 from datetime import date
 from email.message import EmailMessage
 from functools import cache
@@ -31,13 +32,15 @@ SCOPES = [
     "https://www.googleapis.com/auth/drive",
 ]
 
+_CLIENT_ID_PREFIX_RE = re.compile(r"^C?0*")
+
 
 @cache
 def google_authenticate():
     """Authenticate with Google using the credentials in ./config/credentials.json (obtained from Google Cloud Console) and ./config/token.json (user-specific).
 
     If the credentials are not valid, the user is prompted to log in.
-    The credentials are then saved to ./config/token.json for the next run.
+    Refreshed or new credentials are saved to ./config/token.json for the next run.
     Returns the authenticated credentials.
     """
     creds = None
@@ -59,13 +62,33 @@ def google_authenticate():
             )
             creds = flow.run_local_server(port=0)
 
-    # Save the credentials for the next run
-    with Path.open(token_path, "w") as token:
-        token.write(creds.to_json())
+        # Save the credentials for the next run. Other scripts may read or refresh
+        # the token at the same time, so write to a temp file unique to this
+        # process and swap it in.
+        with tempfile.NamedTemporaryFile(
+            "w",
+            dir=token_path.parent,
+            prefix=f"{token_path.name}.",
+            suffix=".tmp",
+            delete=False,
+        ) as tmp_file:
+            tmp_file.write(creds.to_json())
+        Path(tmp_file.name).replace(token_path)
 
     return creds
 
 
+@cache
+def get_google_service(service_name: str, version: str):
+    """Builds a Google API client once per process using the cached credentials.
+
+    Args:
+        service_name: The API name, e.g. "sheets" or "drive".
+        version: The API version, e.g. "v4".
+    """
+    return build(service_name, version, credentials=google_authenticate())
+
+
 def send_gmail(
     message_text: str,
     subject: str,
@@ -86,10 +109,8 @@ def send_gmail(
         html (Optional[str]): The HTML version of the message (optional)
         attachments (Optional[list[dict]]): A list of attachments, where each attachment is a dict with "stream" and "filename" keys (optional)
     """
-    creds = google_authenticate()
-
     try:
-        service = build("gmail", "v1", credentials=creds)
+        service = get_google_service("gmail", "v1")
 
         message = EmailMessage()
         message.set_content(message_text)
@@ -138,52 +159,52 @@ def build_admin_email(email_info: AdminEmailInfo) -> tuple[str, str]:
     Returns:
         tuple[str, str]: A tuple of the text and HTML versions of the email message
     """
-    email_text = ""
-    email_html = ""
+    text_parts: list[str] = []
+    html_parts: list[str] = []
 
     if email_info["errors"]:
-        email_text += (
+        text_parts.append(
             "Errors:\n"
             + "\n".join([f"- {error}" for error in email_info["errors"]])
             + "\n"
         )
-        email_html += (
+        html_parts.append(
             "<h2>Errors</h2><ul><li>"
             + "</li><li>".join(error for error in email_info["errors"])
             + "</li></ul>"
         )
 
     if email_info["completed"]:
-        email_text += (
+        text_parts.append(
             "Download:\n"
             + "\n".join([f"- {client.fullName}" for client in email_info["completed"]])
             + "\n"
         )
-        email_html += (
+        html_parts.append(
             "<h2>Download</h2><ul><li>"
             + "</li><li>".join(client.fullName for client in email_info["completed"])
             + "</li></ul>"
         )
     if email_info["ignoring"]:
-        email_text += (
+        text_parts.append(
             "Check on ignoring:\n"
             + "\n".join([f"- {client.fullName}" for client in email_info["ignoring"]])
             + "\n"
         )
-        email_html += (
+        html_parts.append(
             "<h2>Check on ignoring</h2><ul><li>"
             + "</li><li>".join(client.fullName for client in email_info["ignoring"])
             + "</li></ul>"
         )
     if email_info["failed"]:
-        email_text += (
+        text_parts.append(
             "Failed to message:\n"
             + "\n".join(
                 [f"- {item[0].fullName} ({item[1]})" for item in email_info["failed"]]
             )
             + "\n"
         )
-        email_html += (
+        html_parts.append(
             "<h2>Failed to message</h2><ul><li>"
             + "</li><li>".join(
                 f"{item[0].fullName} ({item[1]})" for item in email_info["failed"]
@@ -209,29 +230,20 @@ def build_admin_email(email_info: AdminEmailInfo) -> tuple[str, str]:
                 return ", post-eval"
             return ""
 
-        email_text += (
-            "Call:\n"
-            + "\n".join(
-                [
-                    f"- {client.fullName} (sent on {(most_recent['sent'] and most_recent['sent'].strftime('%m/%d')) or 'unknown date'}, reminded {str(most_recent['reminded']) + ' times' if most_recent else 'unknown number of times'}{_post_eval_note(client, most_recent)})"
-                    if isinstance(client, ClientWithQuestionnaires)
-                    else f"- {client.fullName} ({most_recent['reason'].capitalize()} on {most_recent['failedDate'].strftime('%m/%d')}, reminded {str(most_recent['reminded']) + ' times'})"
-                    for client, most_recent in call_clients_data
-                ]
-            )
-            + "\n"
+        # The text and HTML sections list the same lines, so format each one once
+        call_lines = [
+            f"{client.fullName} (sent on {(most_recent['sent'] and most_recent['sent'].strftime('%m/%d')) or 'unknown date'}, reminded {str(most_recent['reminded']) + ' times' if most_recent else 'unknown number of times'}{_post_eval_note(client, most_recent)})"
+            if isinstance(client, ClientWithQuestionnaires)
+            else f"{client.fullName} ({most_recent['reason'].capitalize()} on {most_recent['failedDate'].strftime('%m/%d')}, reminded {str(most_recent['reminded']) + ' times'})"
+            for client, most_recent in call_clients_data
+        ]
+        text_parts.append(
+            "Call:\n" + "\n".join(f"- {line}" for line in call_lines) + "\n"
         )
-        email_html += (
-            "<h2>Call</h2><ul><li>"
-            + "</li><li>".join(
-                f"{client.fullName} (sent on {(most_recent['sent'] and most_recent['sent'].strftime('%m/%d')) or 'unknown date'}, reminded {str(most_recent['reminded']) + ' times' if most_recent else 'unknown number of times'}{_post_eval_note(client, most_recent)})"
-                if isinstance(client, ClientWithQuestionnaires)
-                else f"{client.fullName} ({most_recent['reason'].capitalize()} on {most_recent['failedDate'].strftime('%m/%d')}, reminded {str(most_recent['reminded']) + ' times'})"
-                for client, most_recent in call_clients_data
-            )
-            + "</li></ul>"
+        html_parts.append(
+            "<h2>Call</h2><ul><li>" + "</li><li>".join(call_lines) + "</li></ul>"
         )
-    return email_text, email_html
+    return "".join(text_parts), "".join(html_parts)
 
 
 def get_punch_list(config: Config):
@@ -240,10 +252,8 @@ def get_punch_list(config: Config):
     Returns:
         pandas.DataFrame: A DataFrame containing the punch list data.
     """
-    creds = google_authenticate()
-
     try:
-        service = build("sheets", "v4", credentials=creds)
+        service = get_google_service("sheets", "v4")
 
         sheet = service.spreadsheets()
         result = (
@@ -287,7 +297,7 @@ def get_punch_list(config: Config):
             # The may have IDs as "C" + zero-padded 9 digits (e.g. C000012345);
             # strip that down to the bare numeric ID used everywhere else in the codebase.
             df["Client ID"] = df["Client ID"].apply(
-                lambda client_id: re.sub(r"^C?0*", "", client_id)
+                lambda client_id: _CLIENT_ID_PREFIX_RE.sub("", client_id)
             )
 
             # Rebuild the "Human Friendly ID" — this is how TherapyAppointment displays
@@ -329,10 +339,8 @@ def update_punch_list(
     Raises:
         Exception: If anything goes wrong.
     """
-    creds = google_authenticate()
-
     try:
-        service = build("sheets", "v4", credentials=creds)
+        service = get_google_service("sheets", "v4")
         sheet = service.spreadsheets()
         result = (
             sheet.values()
@@ -390,8 +398,7 @@ def batch_update_punch_list(
     if not updates:
         return
 
-    creds = google_authenticate()
-    service = build("sheets", "v4", credentials=creds)
+    service = get_google_service("sheets", "v4")
     sheet = service.spreadsheets()
 
     result = (
@@ -449,10 +456,8 @@ def add_to_failure_sheet(
     questionnaires_generated: list[dict[str, str]] | None = None,
 ):
     """Adds the given failed client to the failure sheet."""
-    creds = google_authenticate()
-
     try:
-        service = build("sheets", "v4", credentials=creds)
+        service = get_google_service("sheets", "v4")
         sheet = service.spreadsheets()
         body = {
             "values": [
@@ -529,10 +534,8 @@ def upload_file_to_drive(
         except Exception as e:
             return f"Error: {e}"
 
-    creds = google_authenticate()
-
     try:
-        service = build("drive", "v3", credentials=creds)
+        service = get_google_service("drive", "v3")
     except Exception:
         logger.exception("Skipping Drive upload: Could not build Drive service")
         return None, None
@@ -1,21 +1,141 @@
-from datetime import datetime, timedelta
+from collections import Counter
+from datetime import date, timedelta
 
 from loguru import logger
 
+from utils.constants import PENDING_STATUSES
 from utils.custom_types import ClientWithQuestionnaires, Config, Questionnaire
 
+PORTAL_LINK = "https://portal.therapyappointment.com"
+
+# Words that change with the number of pending questionnaires, keyed by whether
+# there is exactly one.
+_NUMBER_WORDS_EN = {
+    True: {
+        "q_s": "questionnaire",
+        "it_them": "it",
+        "it_they": "it",
+        "is_are": "is",
+        "its_their": "its",
+    },
+    False: {
+        "q_s": "questionnaires",
+        "it_them": "them",
+        "it_they": "they",
+        "is_are": "are",
+        "its_their": "their",
+    },
+}
+_NUMBER_WORDS_ES = {
+    True: {
+        "q_s": "cuestionario",
+        "lo_los": "lo",
+        "esta_estan": "está",
+        "su_sus": "su",
+        "s": "",
+        "sent_it_them": "Lo enviamos",
+    },
+    False: {
+        "q_s": "cuestionarios",
+        "lo_los": "los",
+        "esta_estan": "están",
+        "su_sus": "sus",
+        "s": "s",
+        "sent_it_them": "Los enviamos",
+    },
+}
+
+# English phrases that depend on how far along the client is.
+_STAGE_PHRASES_EN = {
+    "scheduling": {
+        "next_step": "We are moving towards scheduling an appointment. The next step is ",
+        "unable": "We are unable to schedule your appointment",
+        "consequence": "close out your referral",
+    },
+    "postda": {
+        "next_step": "In order to finalize our review, ",
+        "unable": "We are unable to finalize our review",
+        "consequence": "be unable to move forward",
+    },
+    "posteval": {
+        "next_step": "In order to provide you with a comprehensive report, ",
+        "unable": "We are unable to provide you with a comprehensive report",
+        "consequence": "provide you with an incomplete report",
+    },
+}
+
+# Reminder templates keyed by how many reminders have already been sent.
+_MESSAGES_EN = {
+    0: (
+        "Hello, this is {name} from Driftwood Evaluation Center. "
+        "{next_step}we need you to complete your {q_s}. You can find {it_them} in the messages tab "
+        "in our patient portal: {portal_link} Please reply to this text with any questions. "
+        "Thank you for your help."
+    ),
+    1: (
+        "Hello, this is {name} with Driftwood Evaluation Center. "
+        "We are waiting for you to complete the {q_s} sent to you {distance_phrase}. "
+        "{unable} until {it_they} {is_are} completed "
+        "in {its_their} entirety. You can find {it_them} in the messages tab in our "
+        "patient portal: {portal_link} Please reply to this text with any questions. "
+        "Thank you for your help."
+    ),
+    2: (
+        "This is Driftwood Evaluation Center. If your {q_s} {is_are} not completed by "
+        "{deadline} (3 days from now), "
+        "we will {consequence}. Reply to this text with any concerns. You can find the "
+        "{q_s} in the messages tab in our patient portal: {portal_link}"
+    ),
+}
+_MESSAGES_ES = {
+    0: (
+        "Hola, es {name} de Driftwood Evaluation Center. ¡Estamos listos para "
+        "programar su cita! Para poder programar su cita, necesitamos que complete {su_sus} "
+        "{q_s}. {sent_it_them} a su correo electrónico desde una dirección DriftwoodEval.com. "
+        "Por favor, responda a este mensaje con cualquier pregunta. Gracias."
+    ),
+    1: (
+        "Hola, es {name} de Driftwood Evaluation Center. Estamos esperando que "
+        "complete {su_sus} {q_s} enviado{s} {distance_phrase}. "
+        "No podemos programar su cita hasta que {lo_los} {esta_estan} "
+        "completo{s} en {su_sus} totalidad. {sent_it_them} a su correo electrónico "
+        "desde una dirección DriftwoodEval.com. Por favor, responda a este mensaje con "
+        "cualquier pregunta. Gracias."
+    ),
+    2: (
+        "Es Driftwood Evaluation Center. Si {su_sus} {q_s} no {esta_estan} "
+        "completo{s} antes de "
+        "{deadline} (en 3 días), "
+        "cerraremos su remisión. Responda a este mensaje con cualquier inquietud. "
+        "{sent_it_them} a su correo electrónico desde una dirección DriftwoodEval.com."
+    ),
+}
+
 
 def format_ta_message(questionnaires: list[dict]) -> str:
     """Formats the message to be sent in TA."""
     logger.debug("Formatting TA message")
-    message = ""
+    lines = []
     for q_id, questionnaire in enumerate(questionnaires, start=1):
-        notes = ""
         if "Self" in questionnaire["type"]:
-            notes = " - For client being tested"
-        message += f"{q_id}) {questionnaire['link']}{notes}\n"
+            lines.append(f"{q_id}) {questionnaire['link']} - For client being tested\n")
+        else:
+            lines.append(f"{q_id}) {questionnaire['link']}\n")
     logger.success("Formatted TA message")
-    return message
+    return "".join(lines)
+
+
+def _distance_phrase(sent: date, distance: int, is_spanish: bool) -> str:
+    """Describes when the questionnaires were sent, e.g. "on 01/02 (5 days ago)"."""
+    if distance == 0:
+        return "hoy" if is_spanish else "today"
+    date_str = sent.strftime("%m/%d")
+    if distance == -1:
+        return f"el {date_str} (ayer)" if is_spanish else f"on {date_str} (yesterday)"
+    days_ago = abs(distance)
+    if is_spanish:
+        return f"el {date_str} (hace {days_ago} días)"
+    return f"on {date_str} ({days_ago} days ago)"
 
 
 def build_q_message(
@@ -23,113 +143,59 @@ def build_q_message(
     client: ClientWithQuestionnaires,
     most_recent_q: Questionnaire,
     distance: int,
+    today: date | None = None,
 ) -> str | None:
-    """Builds the message to be sent to the client based on their most recent questionnaire."""
+    """Builds the message to be sent to the client based on their most recent questionnaire.
+
+    Args:
+        config: The application configuration.
+        client: The client being reminded.
+        most_recent_q: The client's most recent questionnaire that isn't done.
+        distance: Days since most_recent_q was sent.
+        today: The date the run started, so callers reminding many clients can
+            look it up once. Defaults to the current date.
+
+    Returns:
+        The message text, or None if there is no message for this reminder count.
+    """
     if not most_recent_q["sent"]:
         logger.warning(
             f"{client.fullName}'s {most_recent_q['questionnaireType']} has no sent date, cannot build message"
         )
         return None
 
-    link_count = len(
-        [
-            q
-            for q in client.questionnaires
-            if q["status"]
-            in [
-                "PENDING",
-                #  "SPANISH"
-                "POSTDA_PENDING",
-                "POSTEVAL_PENDING",
-            ]
-        ]
-    )
     # is_spanish = any(q["status"] == "SPANISH" for q in client.questionnaires)  # noqa: ERA001 maybe someday
     is_spanish = False
-    is_postda = any(q["status"] == "POSTDA_PENDING" for q in client.questionnaires)
-    is_posteval = any(q["status"] == "POSTEVAL_PENDING" for q in client.questionnaires)
-    portal_link = "https://portal.therapyappointment.com"
-
-    if distance == 0:
-        distance_phrase_en = "today"
-        distance_phrase_es = "hoy"
-    elif distance == -1:
-        date_str = most_recent_q["sent"].strftime("%m/%d")
-        distance_phrase_en = f"on {date_str} (yesterday)"
-        distance_phrase_es = f"el {date_str} (ayer)"
-    else:
-        date_str = most_recent_q["sent"].strftime("%m/%d")
-        days_ago = abs(distance)
-        distance_phrase_en = f"on {date_str} ({days_ago} days ago)"
-        distance_phrase_es = f"el {date_str} (hace {days_ago} días)"
-
-    q_s_en = "questionnaire" if link_count == 1 else "questionnaires"
-    it_them_en = "it" if link_count == 1 else "them"
-    it_they_en = "it" if link_count == 1 else "they"
-    is_are_en = "is" if link_count == 1 else "are"
-    its_their_en = "its" if link_count == 1 else "their"
-
-    q_s_es = "cuestionario" if link_count == 1 else "cuestionarios"
-    lo_los_es = "lo" if link_count == 1 else "los"
-    esta_estan_es = "está" if link_count == 1 else "están"
-    su_sus_es = "su" if link_count == 1 else "sus"
-    sent_s_es = "" if link_count == 1 else "s"
-    complete_s_es = "" if link_count == 1 else "s"
-    sent_it_them_es = "Lo enviamos" if link_count == 1 else "Los enviamos"
-
-    messages_en = {
-        0: (
-            f"Hello, this is {config.name} from Driftwood Evaluation Center. "
-            f"{'We are moving towards scheduling an appointment. The next step is ' if not is_posteval else ('In order to finalize our review, ' if is_postda else 'In order to provide you with a comprehensive report, ')}"
-            f"we need you to complete your {q_s_en}. You can find {it_them_en} in the messages tab "
-            f"in our patient portal: {portal_link} Please reply to this text with any questions. "
-            f"Thank you for your help."
-        ),
-        1: (
-            f"Hello, this is {config.name} with Driftwood Evaluation Center. "
-            f"We are waiting for you to complete the {q_s_en} sent to you {distance_phrase_en}. "
-            f"{'We are unable to schedule your appointment' if not is_posteval else ('We are unable to finalize our review' if is_postda else 'We are unable to provide you with a comprehensive report')} until {it_they_en} {is_are_en} completed "
-            f"in {its_their_en} entirety. You can find {it_them_en} in the messages tab in our "
-            f"patient portal: {portal_link} Please reply to this text with any questions. "
-            f"Thank you for your help."
-        ),
-        2: (
-            f"This is Driftwood Evaluation Center. If your {q_s_en} {is_are_en} not completed by "
-            f"{(datetime.now() + timedelta(days=3)).strftime('%m/%d')} (3 days from now), "
-            f"we will {'close out your referral' if not is_posteval else ('be unable to move forward' if is_postda else 'provide you with an incomplete report')}. Reply to this text with any concerns. You can find the "
-            f"{q_s_en} in the messages tab in our patient portal: {portal_link}"
-        ),
-    }
-
-    messages_es = {
-        0: (
-            f"Hola, es {config.name} de Driftwood Evaluation Center. ¡Estamos listos para "
-            f"programar su cita! Para poder programar su cita, necesitamos que complete {su_sus_es} "
-            f"{q_s_es}. {sent_it_them_es} a su correo electrónico desde una dirección DriftwoodEval.com. "
-            f"Por favor, responda a este mensaje con cualquier pregunta. Gracias."
-        ),
-        1: (
-            f"Hola, es {config.name} de Driftwood Evaluation Center. Estamos esperando que "
-            f"complete {su_sus_es} {q_s_es} enviado{sent_s_es} {distance_phrase_es}. "
-            f"No podemos programar su cita hasta que {lo_los_es} {esta_estan_es} "
-            f"completo{complete_s_es} en {su_sus_es} totalidad. {sent_it_them_es} a su correo electrónico "
-            f"desde una dirección DriftwoodEval.com. Por favor, responda a este mensaje con "
-            f"cualquier pregunta. Gracias."
-        ),
-        2: (
-            f"Es Driftwood Evaluation Center. Si {su_sus_es} {q_s_es} no {esta_estan_es} "
-            f"completo{complete_s_es} antes de "
-            f"{(datetime.now() + timedelta(days=3)).strftime('%m/%d')} (en 3 días), "
-            f"cerraremos su remisión. Responda a este mensaje con cualquier inquietud. "
-            f"{sent_it_them_es} a su correo electrónico desde una dirección DriftwoodEval.com."
-        ),
-    }
-
     reminded_count = most_recent_q["reminded"]
+    template = (_MESSAGES_ES if is_spanish else _MESSAGES_EN).get(reminded_count)
+    if template is None:
+        return None
+
+    status_counts = Counter(q["status"] for q in client.questionnaires)
+    link_count = sum(status_counts[status] for status in PENDING_STATUSES)
+    is_postda = status_counts["POSTDA_PENDING"] > 0
+    is_posteval = status_counts["POSTEVAL_PENDING"] > 0
+    is_single = link_count == 1
 
     if is_spanish:
-        message = messages_es.get(reminded_count)
+        fields = dict(_NUMBER_WORDS_ES[is_single])
     else:
-        message = messages_en.get(reminded_count)
+        if not is_posteval:
+            stage = "scheduling"
+        elif is_postda:
+            stage = "postda"
+        else:
+            stage = "posteval"
+        fields = {**_NUMBER_WORDS_EN[is_single], **_STAGE_PHRASES_EN[stage]}
+
+    # Only the follow-up mentions the sent date, and only the final notice the deadline
+    if reminded_count == 1:
+        fields["distance_phrase"] = _distance_phrase(
+            most_recent_q["sent"], distance, is_spanish
+        )
+    elif reminded_count == 2:
+        if today is None:
+            today = date.today()
+        fields["deadline"] = (today + timedelta(days=3)).strftime("%m/%d")
 
-    return message
+    return template.format(name=config.name, portal_link=PORTAL_LINK, **fields)
@@ -198,15 +198,18 @@ def add_failure(
         add_failure_to_db(config, client_id, error, failed_date, daeval)
 
 
-def check_distance(x: date) -> int:
+def check_distance(x: date, today: date | None = None) -> int:
     """Calculate the number of days between the given date and today.
 
     Args:
         x (date): The date to calculate the distance from.
+        today (Optional[date]): The date to measure to, so callers looping over many
+            clients can look it up once. Defaults to the current date.
 
     Returns:
         int: The number of days between x and today.
     """
-    today = date.today()
+    if today is None:
+        today = date.today()
     delta = today - x
     return delta.days
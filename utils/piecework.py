@@ -1,11 +1,15 @@
 import re
+from functools import cache
 from typing import Any
 
 import pandas as pd
 
+_NON_LETTER_RE = re.compile(r"[^a-zA-Z]")
 
+
+@cache
 def extract_writer_initials(assigned_to: Any) -> str:
     """Extract only letters from the assigned to column."""
     if pd.isna(assigned_to) or not assigned_to:
         return ""
-    return re.sub(r"[^a-zA-Z]", "", str(assigned_to))
+    return _NON_LETTER_RE.sub("", str(assigned_to))
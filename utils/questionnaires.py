@@ -19,6 +19,7 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.ui import WebDriverWait
 
+from utils.constants import PENDING_STATUSES
 from utils.custom_types import (
     ClientFromDB,
     ClientWithQuestionnaires,
@@ -39,6 +40,8 @@ from utils.selenium import (
 
 MAX_WORKERS = 5
 
+_UNSAFE_FILENAME_RE = re.compile(r"[^\w\-]+")
+
 
 def _in_current_session(client: ClientWithQuestionnaires, q: Questionnaire) -> bool:
     """Whether a questionnaire dict belongs to the client's current session.
@@ -108,14 +111,14 @@ def generate_screenshot_filename(status: str, q_type: str, url: str) -> str:
     host_parts = parsed.netloc.split(".")
     domain = host_parts[-2] if len(host_parts) > 1 else host_parts[0]
 
-    path_clean = re.sub(r"[^\w\-]+", "_", parsed.path.strip("/"))
-    query_clean = re.sub(r"[^\w\-]+", "_", parsed.query.strip())
+    path_clean = _UNSAFE_FILENAME_RE.sub("_", parsed.path.strip("/"))
+    query_clean = _UNSAFE_FILENAME_RE.sub("_", parsed.query.strip())
 
     url_identity = "_".join(filter(None, [path_clean, query_clean]))
     if not url_identity:
         url_identity = "unknown"
 
-    safe_type = re.sub(r"[^\w\-]+", "_", q_type)
+    safe_type = _UNSAFE_FILENAME_RE.sub("_", q_type)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
     return f"{status.upper()}_{safe_type}_{domain}_{url_identity}_{timestamp}.png"
@@ -254,7 +257,7 @@ def check_questionnaires(
             continue
 
         for questionnaire in client.questionnaires:
-            if questionnaire["status"] == "COMPLETED":
+            if questionnaire["status"] in ("COMPLETED", "EXTERNAL"):
                 logger.info(
                     f"{client.fullName}'s {questionnaire['questionnaireType']} is already done"
                 )
@@ -264,6 +267,11 @@ def check_questionnaires(
                     f"{client.fullName}'s {questionnaire['questionnaireType']} is archived"
                 )
                 continue
+            if not _in_current_session(client, questionnaire):
+                logger.debug(
+                    f"{client.fullName}'s {questionnaire['questionnaireType']} is from a previous session"
+                )
+                continue
             if not questionnaire["link"]:
                 logger.warning(
                     f"No link found for {client.fullName}'s {questionnaire['questionnaireType']}"
@@ -397,12 +405,7 @@ def get_most_recent_not_done(
     pending_and_sent = (
         q
         for q in client.questionnaires
-        if (
-            q["status"] == "PENDING"
-            or q["status"] == "POSTDA_PENDING"
-            or q["status"] == "POSTEVAL_PENDING"
-            # or q["status"] == "SPANISH"
-        )
+        if q["status"] in PENDING_STATUSES
         and q["sent"] is not None
         and _in_current_session(client, q)
     )
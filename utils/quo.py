@@ -1,15 +1,21 @@
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, date, datetime
 
 import requests
 from loguru import logger
-from ratelimit import RateLimitException, limits
+from requests.adapters import HTTPAdapter
 from tenacity import (
     RetryCallState,
     retry,
-    retry_if_exception_type,
+    retry_if_exception,
     retry_if_result,
     stop_after_attempt,
+    stop_after_delay,
     wait_exponential,
+    wait_random_exponential,
 )
 
 from utils.custom_types import Config, Services
@@ -17,6 +23,7 @@ from utils.custom_types import Config, Services
 API_BASE = "https://api.quo.com/v1/"
 RATE_LIMIT_CALLS = 10
 RATE_LIMIT_PERIOD = 1
+_NON_DIGIT_RE = re.compile(r"\D")
 
 
 def before_sleep_loguru(retry_state: RetryCallState) -> None:
@@ -43,6 +50,10 @@ def before_sleep_loguru(retry_state: RetryCallState) -> None:
     )
 
 
+# Statuses after which a message will not change again
+FINAL_STATUSES = frozenset({"delivered", "undelivered", "failed"})
+
+
 def should_continue_polling(status: str) -> bool:
     """
     Retry Condition:
@@ -53,6 +64,14 @@ def should_continue_polling(status: str) -> bool:
     return status in pending_statuses
 
 
+def phone_number_key(phone: str) -> str:
+    """Reduce a US phone number to its 10 digits so differently formatted copies match."""
+    digits = _NON_DIGIT_RE.sub("", phone)
+    if len(digits) == 11 and digits.startswith("1"):
+        return digits[1:]
+    return digits
+
+
 class NotEnoughCreditsError(requests.HTTPError):
     """Custom exception for payment/credit limits."""
 
@@ -67,12 +86,49 @@ class InvalidPhoneNumberError(ValueError):
         super().__init__(message)
 
 
-def is_transient_error(exception: Exception) -> bool:
+def is_transient_error(exception: BaseException) -> bool:
     """Check if the exception is a transient error that should be retried."""
     if isinstance(exception, requests.HTTPError) and exception.response is not None:
         # Do not retry on 400, 401, 403, 404, 422
         return exception.response.status_code not in [400, 401, 403, 404, 422]
-    return isinstance(exception, (requests.ConnectionError, RateLimitException))
+    return isinstance(exception, requests.ConnectionError)
+
+
+def is_safe_to_resend(exception: BaseException) -> bool:
+    """Check if a failed send certainly never reached Quo, so retrying can't double-text."""
+    if isinstance(exception, requests.HTTPError) and exception.response is not None:
+        return exception.response.status_code == 429
+    return isinstance(exception, requests.ConnectTimeout)
+
+
+class _TokenBucket:
+    """Blocking token bucket that keeps calls under the API rate limit."""
+
+    __slots__ = ("capacity", "last", "lock", "rate", "tokens")
+
+    def __init__(self, capacity: int, rate: float):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> None:
+        """Take one token, sleeping until one is available."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.capacity, self.tokens + (now - self.last) * self.rate
+            )
+            self.last = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+
+            # Hold the lock while waiting so queued callers go out one at a time
+            time.sleep((1 - self.tokens) / self.rate)
+            self.tokens = 0.0
+            self.last = time.monotonic()
 
 
 class Quo:
@@ -83,7 +139,18 @@ class Quo:
         self.main_number = services.openphone.main_number
         self.default_user = self._resolve_user_id(config.name, services.openphone.users)
 
+        # Send responses that already carry a final status, so polling can be skipped
+        self._final_statuses: dict[str, str] = {}
+        self._bucket = _TokenBucket(
+            RATE_LIMIT_CALLS, RATE_LIMIT_CALLS / RATE_LIMIT_PERIOD
+        )
+        # One keep-alive connection pool for the whole run. Retries are handled by
+        # tenacity, so the adapter itself never retries.
         self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=0),
+        )
         self.session.headers.update(
             {
                 "Content-Type": "application/json",
@@ -100,25 +167,37 @@ class Quo:
         logger.error(f"User '{config_name} not found in Quo. Using number owner.")
         return None
 
+    # Jittered so concurrent pollers that fail together don't retry in lockstep
     _retry_network = retry(
-        retry=retry_if_exception_type(Exception) & retry_if_result(is_transient_error),
-        wait=wait_exponential(multiplier=1, min=2, max=30),
-        stop=stop_after_attempt(5),
+        retry=retry_if_exception(is_transient_error),
+        wait=wait_random_exponential(multiplier=1, min=2, max=30),
+        stop=stop_after_attempt(5) | stop_after_delay(30),
         before_sleep=before_sleep_loguru,
     )
 
+    # A 5xx or dropped connection can come after Quo has accepted the message, so
+    # sends only retry when the request was rejected or never connected.
+    _retry_send = retry(
+        retry=retry_if_exception(is_safe_to_resend),
+        wait=wait_random_exponential(multiplier=1, min=2, max=30),
+        stop=stop_after_attempt(5) | stop_after_delay(30),
+        before_sleep=before_sleep_loguru,
+    )
+
+    # Most texts are delivered within a second or two, so start polling quickly
+    # and back off to a few seconds, giving up after about a minute.
     _retry_poll_delivery = retry(
         retry=retry_if_result(should_continue_polling),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        stop=stop_after_attempt(10),
+        wait=wait_exponential(multiplier=0.25, min=0.25, max=3),
+        stop=stop_after_delay(60),
         before_sleep=before_sleep_loguru,
     )
 
-    @limits(calls=RATE_LIMIT_CALLS, period=RATE_LIMIT_PERIOD)
     @_retry_network
     def get_text_info(self, message_id: str) -> dict:
         """Retrieves raw info dict. Retries only on network errors."""
         url = f"{API_BASE}messages/{message_id}"
+        self._bucket.take()
         response = self.session.get(url)
         response.raise_for_status()
         return response.json().get("data", {})
@@ -139,7 +218,9 @@ class Quo:
         Returns True only if strictly 'delivered'.
         """
         try:
-            final_status = self._poll_delivery_status(message_id)
+            final_status = self._final_statuses.get(message_id)
+            if final_status is None:
+                final_status = self._poll_delivery_status(message_id)
             if final_status == "delivered":
                 return True
 
@@ -150,11 +231,25 @@ class Quo:
             logger.error(f"Failed to verify delivery for {message_id}: {e}")
             return False
 
-    @limits(calls=RATE_LIMIT_CALLS, period=RATE_LIMIT_PERIOD)
+    def check_texts_delivered(self, message_ids: list[str]) -> dict[str, bool]:
+        """Polls several messages concurrently, returning delivery status by message ID.
+
+        Each poll spends most of its time sleeping between status checks, so running
+        them side by side cuts the wait from the sum of the polls to roughly the
+        longest one. The shared token bucket still caps the request rate.
+        """
+        if not message_ids:
+            return {}
+        workers = min(RATE_LIMIT_CALLS, len(message_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self.check_text_delivered, message_ids)
+            return dict(zip(message_ids, results, strict=True))
+
     @_retry_network
     def _fetch_phone_number_id(self) -> str | None:
         """Fetch the Quo phone number ID for the main number."""
         url = f"{API_BASE}phone-numbers"
+        self._bucket.take()
         response = self.session.get(url)
         response.raise_for_status()
         for pn in response.json().get("data", []):
@@ -175,7 +270,7 @@ class Quo:
         if not phone_number_id:
             return False
 
-        digits = "".join(filter(str.isdigit, client_phone))
+        digits = _NON_DIGIT_RE.sub("", client_phone)
         if len(digits) == 10:
             clean_phone = "+1" + digits
         elif len(digits) == 11 and digits.startswith("1"):
@@ -198,6 +293,7 @@ class Quo:
                 )
                 params.append(("createdAfter", since_dt.isoformat()))
 
+            self._bucket.take()
             response = self.session.get(url, params=params)
             response.raise_for_status()
             data = response.json().get("data", [])
@@ -222,8 +318,7 @@ class Quo:
             logger.error(f"Failed to check incoming messages for {client_phone}: {e}")
             return False
 
-    @limits(calls=RATE_LIMIT_CALLS, period=RATE_LIMIT_PERIOD)
-    @_retry_network
+    @_retry_send
     def send_text(
         self,
         message: str,
@@ -232,13 +327,13 @@ class Quo:
         user_blame: str | None = None,
         mark_done: bool = False,
     ) -> dict | None:
-        """Sends text. Retries on network errors. Fails fast on payment errors."""
+        """Sends text. Retries only when the send never reached Quo. Fails fast on payment errors."""
         if from_number is None:
             from_number = self.main_number
         if user_blame is None:
             user_blame = self.default_user
 
-        digits = "".join(filter(str.isdigit, to_number))
+        digits = _NON_DIGIT_RE.sub("", to_number)
 
         if len(digits) == 10:
             if digits.startswith("1"):
@@ -271,6 +366,7 @@ class Quo:
 
         try:
             logger.info(f"Sending message to {to_number_clean}...")
+            self._bucket.take()
             response = self.session.post(url, json=payload)
 
             if response.status_code == 402:
@@ -280,7 +376,10 @@ class Quo:
                 logger.error(f"Bad Request to Quo: {response.text}")
 
             response.raise_for_status()
-            return response.json().get("data")
+            data = response.json().get("data")
+            if data and "id" in data and data.get("status") in FINAL_STATUSES:
+                self._final_statuses[data["id"]] = data["status"]
+            return data
 
         except NotEnoughCreditsError:
             # Catch explicitly to avoid the Retry decorator handling it
@@ -2,14 +2,16 @@ import re
 
 from utils.custom_types import RecordsContact
 
+_DISTRICT_SUFFIX_RE = re.compile(
+    r"\b(county school district|school district|county)\b", re.IGNORECASE
+)
+
 
 def normalize_district(name: str | None) -> str:
     if not name:
         return ""
 
-    pattern = r"\b(county school district|school district|county)\b"
-
-    clean = re.sub(rf"(?i){pattern}", "", name)
+    clean = _DISTRICT_SUFFIX_RE.sub("", name)
 
     return " ".join(clean.split()).lower()
 
@@ -22,6 +24,6 @@ def resolve_school_contact(
     if name in school_contacts:
         return name, school_contacts[name]
     for canonical_name, contact in school_contacts.items():
-        if name in [a.lower().strip() for a in contact.aliases]:
+        if name in contact.aliases:
             return canonical_name, contact
     return None, None